@@ -0,0 +1,8 @@
+def pytest_collection_modifyitems(config, items):
+    """Schedule the tests marked as slow first.
+
+    pytest-xdist dispatches tests in collection order, so putting the
+    heavier classes at the front lets the workers balance them across
+    cores instead of picking them up last.
+    """
+    items.sort(key=lambda item: 0 if item.get_closest_marker("slow") else 1)
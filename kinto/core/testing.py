@@ -1,3 +1,4 @@
+import functools
 import os
 import threading
 import unittest
@@ -10,7 +11,7 @@ from pyramid.url import parse_url_overrides
 
 from kinto.core import DEFAULT_SETTINGS
 from kinto.core.storage import generators
-from kinto.core.utils import encode64, follow_subrequest, memcache, sqlalchemy
+from kinto.core.utils import encode64, follow_subrequest, json, memcache, sqlalchemy
 from kinto.plugins import prometheus, statsd
 
 
@@ -56,8 +57,50 @@ class DummyRequest(mock.MagicMock):
     follow_subrequest = follow_subrequest
 
 
+class TestResponse(webtest.response.TestResponse):
+    """Test response using the C-accelerated JSON parser for ``resp.json``."""
+
+    @property
+    def json_body(self):
+        return json.loads(self.body)
+
+
+def _json_method(method):
+    """Same as :func:`webtest.utils.json_method`, with the C-accelerated
+    JSON serializer instead of the stdlib one."""
+
+    def wrapper(self, url, params=webtest.utils.NoDefault, **kw):
+        kw.setdefault("content_type", "application/json")
+        if params is not webtest.utils.NoDefault:
+            params = json.dumps(params)
+        kw.update(params=params, upload_files=None)
+        return self._gen_request(method, url, **kw)
+
+    wrapper.__name__ = f"{method.lower()}_json"
+    return wrapper
+
+
+class TestApp(webtest.TestApp):
+    """Test application whose ``*_json`` methods serialize the payloads
+    with the C-accelerated JSON serializer."""
+
+    post_json = _json_method("POST")
+    put_json = _json_method("PUT")
+    patch_json = _json_method("PATCH")
+    delete_json = _json_method("DELETE")
+
+
+@functools.lru_cache(maxsize=None)
 def get_request_class(prefix):
+    """Return a request class prefixing the paths with the API version.
+
+    Memoized: synthesizing a class per test application is wasteful, and the
+    result only depends on the prefix.
+    """
+
     class PrefixedRequestClass(webtest.app.TestRequest):
+        ResponseClass = TestResponse
+
         @classmethod
         def blank(cls, path, *args, **kwargs):
             if prefix:
@@ -113,6 +156,9 @@ class BaseWebTest:
 
     @classmethod
     def setUpClass(cls):
+        # Give each class its own copy, so that ``cls.headers.update()`` in
+        # subclasses does not leak into the other test classes.
+        cls.headers = {**cls.headers}
         cls.app = cls.make_app()
         cls.storage = cls.app.app.registry.storage
         cls.cache = cls.app.app.registry.cache
@@ -133,13 +179,22 @@ class BaseWebTest:
         """
         settings = cls.get_app_settings(extras=settings)
 
-        main = cls.entry_point
-
-        wsgi_app = main({}, config=config, **settings)
-        app = webtest.TestApp(wsgi_app)
+        wsgi_app = cls.make_wsgi_app(settings, config)
+        app = TestApp(wsgi_app)
         app.RequestClass = get_request_class(cls.api_prefix)
         return app
 
+    @classmethod
+    def make_wsgi_app(cls, settings, config=None):
+        """Instantiate the raw WSGI application from the entry point.
+
+        :param dict settings: complete settings values
+        :param pyramid.config.Configurator config: already initialized config
+        :returns: WSGI application instance
+        """
+        main = cls.entry_point
+        return main({}, config=config, **settings)
+
     @classmethod
     def get_app_settings(cls, extras=None):
         """Application settings to be used. Override to tweak default settings
@@ -1,15 +1,22 @@
+import json
 import uuid
 from unittest import mock
 
+import pytest
+
 from kinto.core.errors import ERRORS
 from kinto.core.storage import exceptions as storage_exceptions
 from kinto.core.testing import FormattedErrorMixin, unittest
+from kinto.core.views import errors as errors_views
 
 from ..support import BaseWebTest
 
 
 MINIMALIST_OBJECT = {"name": "Champignon"}
 
+# Serialized once: the seeding requests post the same payload over and over.
+MINIMALIST_BODY = json.dumps({"data": MINIMALIST_OBJECT})
+
 
 class AuthzAuthnTest(BaseWebTest, unittest.TestCase):
     authorization_policy = "kinto.core.authorization.AuthorizationPolicy"
@@ -325,12 +332,11 @@ class OptionalSchemaTest(BaseWebTest, unittest.TestCase):
         self.assertIn("edible", resp.json["data"])
 
 
-class InvalidObjectTest(BaseWebTest, unittest.TestCase):
+class InvalidObjectTest(BaseWebTest, FormattedErrorMixin, unittest.TestCase):
     def setUp(self):
         super().setUp()
-        body = {"data": MINIMALIST_OBJECT}
-        resp = self.app.post_json(self.plural_url, body, headers=self.headers)
-        self.obj = resp.json["data"]
+        self.obj = self.seed_object(MINIMALIST_OBJECT)
+        self.object_url = self.get_item_url()
 
         self.invalid_object = {"data": {"name": 42}}
 
@@ -339,21 +345,22 @@ class InvalidObjectTest(BaseWebTest, unittest.TestCase):
             self.plural_url, self.invalid_object, headers=self.headers, status=400
         )
         # XXX: weird resp.json['message']
-        self.assertDictEqual(
-            resp.json,
-            {
-                "errno": ERRORS.INVALID_PARAMETERS.value,
-                "message": "data.name in body: 42 is not a string: {'name': ''}",
-                "code": 400,
-                "error": "Invalid parameters",
-                "details": [
-                    {
-                        "description": "42 is not a string: {'name': ''}",
-                        "location": "body",
-                        "name": "data.name",
-                    }
-                ],
-            },
+        self.assertFormattedError(
+            resp,
+            400,
+            ERRORS.INVALID_PARAMETERS,
+            "Invalid parameters",
+            "data.name in body: 42 is not a string: {'name': ''}",
+        )
+        self.assertEqual(
+            resp.json["details"],
+            [
+                {
+                    "description": "42 is not a string: {'name': ''}",
+                    "location": "body",
+                    "name": "data.name",
+                }
+            ],
         )
 
     def test_empty_body_returns_400(self):
@@ -371,20 +378,16 @@ class InvalidObjectTest(BaseWebTest, unittest.TestCase):
         self.assertIn("datta", resp.json["message"])
 
     def test_create_invalid_object_returns_400(self):
-        self.app.post_json(self.plural_url, self.invalid_object, headers=self.headers, status=400)
+        self.call_view("POST", self.plural_url, json.dumps(self.invalid_object), status=400)
 
     def test_modify_with_invalid_object_returns_400(self):
-        self.app.patch_json(
-            self.get_item_url(), self.invalid_object, headers=self.headers, status=400
-        )
+        self.call_view("PATCH", self.object_url, json.dumps(self.invalid_object), status=400)
 
     def test_modify_with_unknown_attribute_returns_400(self):
-        self.app.patch_json(self.get_item_url(), {"datta": {}}, headers=self.headers, status=400)
+        self.call_view("PATCH", self.object_url, '{"datta": {}}', status=400)
 
     def test_replace_with_invalid_object_returns_400(self):
-        self.app.put_json(
-            self.get_item_url(), self.invalid_object, headers=self.headers, status=400
-        )
+        self.call_view("PUT", self.object_url, json.dumps(self.invalid_object), status=400)
 
     def test_id_is_validated_on_post(self):
         obj = {**MINIMALIST_OBJECT, "id": 3.14}
@@ -398,7 +401,8 @@ class InvalidObjectTest(BaseWebTest, unittest.TestCase):
     def test_id_is_preserved_on_post(self):
         obj = {**MINIMALIST_OBJECT, "id": "472be9ec-26fe-461b-8282-9c4e4b207ab3"}
         resp = self.app.post_json(self.plural_url, {"data": obj}, headers=self.headers)
-        self.assertEqual(resp.json["data"]["id"], obj["id"])
+        # A raw scan is enough here, no need to parse the whole payload.
+        self.assertIn(obj["id"].encode(), resp.body)
 
     def test_200_is_returned_if_id_matches_existing_object(self):
         obj = {**MINIMALIST_OBJECT, "id": self.obj["id"]}
@@ -420,14 +424,14 @@ class InvalidObjectTest(BaseWebTest, unittest.TestCase):
 
     def test_invalid_accept_header_on_object_returns_406(self):
         headers = {**self.headers, "Accept": "text/plain"}
-        resp = self.app.get(self.get_item_url(), headers=headers, status=406)
+        resp = self.app.get(self.object_url, headers=headers, status=406)
         self.assertEqual(resp.json["code"], 406)
         message = "Accept header should be one of ['application/json']"
         self.assertEqual(resp.json["message"], message)
 
     def test_invalid_content_type_header_on_object_returns_415(self):
         headers = {**self.headers, "Content-Type": "text/plain"}
-        resp = self.app.patch_json(self.get_item_url(), "", headers=headers, status=415)
+        resp = self.app.patch_json(self.object_url, "", headers=headers, status=415)
         self.assertEqual(resp.json["code"], 415)
         messages = (
             "Content-Type header should be one of [",
@@ -446,9 +450,8 @@ class InvalidObjectTest(BaseWebTest, unittest.TestCase):
 class IgnoredFieldsTest(BaseWebTest, unittest.TestCase):
     def setUp(self):
         super().setUp()
-        body = {"data": MINIMALIST_OBJECT}
-        resp = self.app.post_json(self.plural_url, body, headers=self.headers)
-        self.obj = resp.json["data"]
+        self.obj = self.seed_object(MINIMALIST_OBJECT)
+        self.object_url = self.get_item_url()
 
     def test_last_modified_is_not_validated_and_overwritten(self):
         obj = {**MINIMALIST_OBJECT, "last_modified": "abc"}
@@ -457,118 +460,106 @@ class IgnoredFieldsTest(BaseWebTest, unittest.TestCase):
 
     def test_modify_works_with_invalid_last_modified(self):
         body = {"data": {"last_modified": "abc"}}
-        resp = self.app.patch_json(self.get_item_url(), body, headers=self.headers)
+        resp = self.app.patch_json(self.object_url, body, headers=self.headers)
         self.assertNotEqual(resp.json["data"]["last_modified"], "abc")
 
     def test_replace_works_with_invalid_last_modified(self):
         obj = {**MINIMALIST_OBJECT, "last_modified": "abc"}
-        resp = self.app.put_json(self.get_item_url(), {"data": obj}, headers=self.headers)
+        resp = self.app.put_json(self.object_url, {"data": obj}, headers=self.headers)
         self.assertNotEqual(resp.json["data"]["last_modified"], "abc")
 
 
-class InvalidBodyTest(BaseWebTest, unittest.TestCase):
+class InvalidBodyTest(BaseWebTest, FormattedErrorMixin, unittest.TestCase):
     invalid_body = "{'foo>}"
 
     def setUp(self):
         super().setUp()
-        body = {"data": MINIMALIST_OBJECT}
-        resp = self.app.post_json(self.plural_url, body, headers=self.headers)
-        self.obj = resp.json["data"]
+        self.obj = self.seed_object(MINIMALIST_OBJECT)
+        self.object_url = self.get_item_url()
 
     def test_invalid_body_returns_json_formatted_error(self):
-        self.maxDiff = None
         resp = self.app.post(self.plural_url, self.invalid_body, headers=self.headers, status=400)
         error_msg = "Invalid JSON: Parse error at offset 1: Missing a name for object member."
-        self.assertDictEqual(
-            resp.json,
-            {
-                "errno": ERRORS.INVALID_PARAMETERS.value,
-                "message": error_msg,
-                "code": 400,
-                "error": "Invalid parameters",
-                "details": [
-                    {"description": error_msg, "location": "body", "name": ""},
-                    {"description": "Required", "location": "body", "name": ""},
-                ],
-            },
+        self.assertFormattedError(
+            resp, 400, ERRORS.INVALID_PARAMETERS, "Invalid parameters", error_msg
         )
-
-    def test_create_invalid_body_returns_400(self):
-        self.app.post(self.plural_url, self.invalid_body, headers=self.headers, status=400)
-
-    def test_modify_with_invalid_body_returns_400(self):
-        self.app.patch(self.get_item_url(), self.invalid_body, headers=self.headers, status=400)
-
-    def test_replace_with_invalid_body_returns_400(self):
-        self.app.put(self.get_item_url(), self.invalid_body, headers=self.headers, status=400)
-
-    def test_invalid_uft8_returns_400(self):
-        body = '{"foo": "\\u0d1"}'
-        resp = self.app.post(self.plural_url, body, headers=self.headers, status=400)
-        self.assertIn(
-            "Invalid JSON: Parse error at offset 9: Incorrect hex digit after \\u escape in string.",
-            resp.json["message"],
+        self.assertEqual(
+            resp.json["details"],
+            [
+                {"description": error_msg, "location": "body", "name": ""},
+                {"description": "Required", "location": "body", "name": ""},
+            ],
         )
 
-    def test_modify_with_invalid_uft8_returns_400(self):
+    def test_invalid_body_returns_400_on_all_methods(self):
+        for method, url in [
+            ("POST", self.plural_url),
+            ("PATCH", self.object_url),
+            ("PUT", self.object_url),
+        ]:
+            with self.subTest(method=method):
+                self.call_view(method, url, self.invalid_body, status=400)
+
+    def test_invalid_uft8_returns_400_on_all_methods(self):
         body = '{"foo": "\\u0d1"}'
-        resp = self.app.patch(self.get_item_url(), body, headers=self.headers, status=400)
-        self.assertIn(
-            "Invalid JSON: Parse error at offset 9: Incorrect hex digit after \\u escape in string.",
-            resp.json["message"],
-        )
+        for method, url in [("POST", self.plural_url), ("PATCH", self.object_url)]:
+            with self.subTest(method=method):
+                resp = self.call_view(method, url, body, status=400)
+                self.assertIn(
+                    "Invalid JSON: Parse error at offset 9: "
+                    "Incorrect hex digit after \\u escape in string.",
+                    resp.json["message"],
+                )
 
     def test_modify_with_empty_body_returns_400(self):
-        self.app.patch(self.get_item_url(), headers=self.headers, status=400)
+        self.call_view("PATCH", self.object_url, status=400)
 
     def test_modify_shareable_resource_with_empty_body_returns_400(self):
-        body = {"data": MINIMALIST_OBJECT}
-        resp = self.app.post_json("/toadstools", body, headers=self.headers)
+        resp = self.app.post("/toadstools", MINIMALIST_BODY, headers=self.headers)
         obj = resp.json["data"]
         item_url = "/toadstools/{}".format(obj["id"])
         self.app.patch(item_url, headers=self.headers, status=400)
 
 
-class InvalidPermissionsTest(BaseWebTest, unittest.TestCase):
+class InvalidPermissionsTest(BaseWebTest, FormattedErrorMixin, unittest.TestCase):
     plural_url = "/toadstools"
 
     def setUp(self):
         super().setUp()
-        body = {"data": MINIMALIST_OBJECT}
-        resp = self.app.post_json(self.plural_url, body, headers=self.headers)
+        resp = self.app.post(self.plural_url, MINIMALIST_BODY, headers=self.headers)
         self.obj = resp.json["data"]
+        self.object_url = self.get_item_url()
         self.invalid_body = {
             "data": MINIMALIST_OBJECT,
             "permissions": {"read": "book"},
         }  # book not list
 
     def test_create_invalid_body_returns_400(self):
-        self.app.post_json(self.plural_url, self.invalid_body, headers=self.headers, status=400)
+        self.call_view("POST", self.plural_url, json.dumps(self.invalid_body), status=400)
 
     def test_modify_with_invalid_permissions_returns_400(self):
-        self.app.patch_json(
-            self.get_item_url(), self.invalid_body, headers=self.headers, status=400
-        )
+        self.call_view("PATCH", self.object_url, json.dumps(self.invalid_body), status=400)
 
     def test_invalid_body_returns_json_formatted_error(self):
         resp = self.app.post_json(
             self.plural_url, self.invalid_body, headers=self.headers, status=400
         )
-        self.assertDictEqual(
-            resp.json,
-            {
-                "errno": ERRORS.INVALID_PARAMETERS.value,
-                "message": 'permissions.read in body: "book" is not iterable',
-                "code": 400,
-                "error": "Invalid parameters",
-                "details": [
-                    {
-                        "description": '"book" is not iterable',
-                        "location": "body",
-                        "name": "permissions.read",
-                    }
-                ],
-            },
+        self.assertFormattedError(
+            resp,
+            400,
+            ERRORS.INVALID_PARAMETERS,
+            "Invalid parameters",
+            'permissions.read in body: "book" is not iterable',
+        )
+        self.assertEqual(
+            resp.json["details"],
+            [
+                {
+                    "description": '"book" is not iterable',
+                    "location": "body",
+                    "name": "permissions.read",
+                }
+            ],
         )
 
 
@@ -610,71 +601,80 @@ class CacheControlTest(BaseWebTest, unittest.TestCase):
 
 
 class StorageErrorTest(BaseWebTest, unittest.TestCase):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.error = storage_exceptions.BackendError(ValueError())
+    error = storage_exceptions.BackendError(ValueError())
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Build the patcher once; start()/stop() per test is cheap.
+        cls.create_patcher = mock.patch.object(cls.storage, "create", side_effect=cls.error)
+
+    def setUp(self):
+        super().setUp()
+        self.create_patcher.start()
+        self.addCleanup(self.create_patcher.stop)
 
     def test_backend_errors_are_served_as_503(self):
         body = {"data": MINIMALIST_OBJECT}
-        with mock.patch.object(self.app.app.registry.storage, "create", side_effect=self.error):
-            self.app.post_json(self.plural_url, body, headers=self.headers, status=503)
+        self.app.post_json(self.plural_url, body, headers=self.headers, status=503)
 
     def test_backend_errors_original_error_is_logged(self):
         body = {"data": MINIMALIST_OBJECT}
-        with mock.patch("kinto.core.views.errors.logger.critical") as mocked:
-            with mock.patch.object(
-                self.app.app.registry.storage, "create", side_effect=self.error
-            ):
-                self.app.post_json(self.plural_url, body, headers=self.headers, status=503)
-                self.assertTrue(mocked.called)
-                self.assertEqual(type(mocked.call_args[0][0]), ValueError)
+        with mock.patch.object(errors_views.logger, "critical") as mocked:
+            self.app.post_json(self.plural_url, body, headers=self.headers, status=503)
+            self.assertTrue(mocked.called)
+            self.assertEqual(type(mocked.call_args[0][0]), ValueError)
 
 
+@pytest.mark.slow
 class PaginationNextURLTest(BaseWebTest, unittest.TestCase):
     """Extra tests for `tests.core.resource.test_pagination`"""
 
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Expensive to construct, and identical for the four tests below:
+        # build the request once and copy it per test.
+        cls.limit_request = cls.app.RequestClass.blank(
+            cls.plural_url + "?_limit=1", headers=cls.headers
+        )
+
     def setUp(self):
         super().setUp()
-        body = {"data": MINIMALIST_OBJECT}
-        self.app.post_json(self.plural_url, body, headers=self.headers)
-        self.app.post_json(self.plural_url, body, headers=self.headers)
+        self.seed_object(MINIMALIST_OBJECT)
+        self.seed_object(MINIMALIST_OBJECT)
+
+    def get_next_page(self, extra_environ=None, headers=None):
+        request = self.limit_request.copy()
+        if extra_environ:
+            request.environ.update(extra_environ)
+        if headers:
+            request.headers.update(headers)
+        return request.get_response(self.app.app).headers["Next-Page"]
 
     def test_next_page_url_has_got_port_number_if_different_than_80(self):
-        resp = self.app.get(
-            self.plural_url + "?_limit=1",
-            extra_environ={"HTTP_HOST": "localhost:8000"},
-            headers=self.headers,
-        )
-        self.assertIn(":8000", resp.headers["Next-Page"])
+        next_page = self.get_next_page(extra_environ={"HTTP_HOST": "localhost:8000"})
+        self.assertIn(":8000", next_page)
 
     def test_next_page_url_has_not_port_number_if_80(self):
-        resp = self.app.get(
-            self.plural_url + "?_limit=1",
-            extra_environ={"HTTP_HOST": "localhost:80"},
-            headers=self.headers,
-        )
-        self.assertNotIn(":80", resp.headers["Next-Page"])
+        next_page = self.get_next_page(extra_environ={"HTTP_HOST": "localhost:80"})
+        self.assertNotIn(":80", next_page)
 
     def test_next_page_url_relies_on_pyramid_url_system(self):
-        resp = self.app.get(
-            self.plural_url + "?_limit=1",
-            extra_environ={"wsgi.url_scheme": "https"},
-            headers=self.headers,
-        )
-        self.assertIn("https://", resp.headers["Next-Page"])
+        next_page = self.get_next_page(extra_environ={"wsgi.url_scheme": "https"})
+        self.assertIn("https://", next_page)
 
     def test_next_page_url_relies_on_headers_information(self):
-        headers = {**self.headers, "Host": "https://server.name:443"}
-        resp = self.app.get(self.plural_url + "?_limit=1", headers=headers)
-        self.assertIn("https://server.name:443", resp.headers["Next-Page"])
+        next_page = self.get_next_page(headers={"Host": "https://server.name:443"})
+        self.assertIn("https://server.name:443", next_page)
 
 
+@pytest.mark.slow
 class PluralDeleteTest(BaseWebTest, unittest.TestCase):
     def setUp(self):
         super().setUp()
-        body = {"data": MINIMALIST_OBJECT}
-        self.app.post_json(self.plural_url, body, headers=self.headers)
-        self.app.post_json(self.plural_url, body, headers=self.headers)
+        self.app.post(self.plural_url, MINIMALIST_BODY, headers=self.headers)
+        self.app.post(self.plural_url, MINIMALIST_BODY, headers=self.headers)
 
     def test_timestamp_is_bumped_if_some_were_deleted(self):
         timestamp_before = self.app.get(self.plural_url, headers=self.headers).headers["ETag"]
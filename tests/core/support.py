@@ -14,6 +14,21 @@ from .testapp import main as testapp
 # This is the principal a connected user should have (in the tests).
 USER_PRINCIPAL = "basicauth:8a931a10fc88ab2f6d1cc02a07d3a81b5d4768f6f13e85c5d8d4180419acb1b4"
 
+# Authentication headers of that user, computed once for every test class.
+USER_HEADERS = testing.get_user_headers("mat")
+
+# Initializing the application is the most expensive part of the tests setup
+# (settings parsing, backends registration, views scanning), and most test
+# classes use the exact same settings. Cache the WSGI apps per settings so
+# that those classes share a single bootstrap. Building an app applies its
+# settings to module-level cornice services, so the cache only keeps apps
+# built since the last construction (any other build invalidates it).
+_wsgi_apps = {}
+
+# Parent ids under which the resources store the test user objects
+# (see ``BaseWebTest.seed_object``).
+_seed_parent_ids = {}
+
 
 class BaseWebTest(testing.BaseWebTest):
     """Base Web Test to test your cornice service.
@@ -30,7 +45,21 @@ class BaseWebTest(testing.BaseWebTest):
     @classmethod
     def setUpClass(cls):
         super().setUpClass()
-        cls.headers.update(testing.get_user_headers("mat"))
+        cls.headers.update(USER_HEADERS)
+
+    @classmethod
+    def make_wsgi_app(cls, settings, config=None):
+        if config is not None:
+            # An initialized config carries test-specific state (subscribers,
+            # patched registry) and cannot be shared.
+            _wsgi_apps.clear()
+            return super().make_wsgi_app(settings, config)
+        key = (cls.entry_point, repr(sorted(settings.items(), key=repr)))
+        if key not in _wsgi_apps:
+            wsgi_app = super().make_wsgi_app(settings, config)
+            _wsgi_apps.clear()
+            _wsgi_apps[key] = wsgi_app
+        return _wsgi_apps[key]
 
     @classmethod
     def get_app_settings(cls, extras=None):
@@ -51,6 +80,43 @@ class BaseWebTest(testing.BaseWebTest):
             id = self.obj["id"]
         return "{}/{}".format(self.plural_url, id)
 
+    def call_view(self, method, path, body=None, headers=None, status=None):
+        """Call the application directly, bypassing the webtest machinery.
+
+        Cheaper than ``self.app`` requests (no lint middleware, cookiejar
+        nor response parsing) for tests that only assert on the status code.
+        """
+        request = self.app.RequestClass.blank(path, headers=headers or self.headers)
+        request.method = method
+        if body is not None:
+            request.body = body if isinstance(body, bytes) else body.encode("utf-8")
+        response = request.get_response(self.app.app)
+        if status is not None:
+            self.assertEqual(response.status_code, status)
+        return response
+
+    def seed_object(self, obj, resource_name="mushroom", plural_url=None):
+        """Create an object directly in storage, skipping the HTTP layer.
+
+        Fixtures seeding does not need to exercise the full request cycle
+        (view resolution, schema validation, serialization).
+
+        The parent id under which the resource stores the test user objects
+        depends on its ``get_parent_id()``, so the first seeding of each
+        resource goes through HTTP once and records it.
+        """
+        parent_id = _seed_parent_ids.get(resource_name)
+        if parent_id is not None:
+            return self.storage.create(
+                resource_name=resource_name, parent_id=parent_id, obj=dict(obj)
+            )
+        with mock.patch.object(self.storage, "create", wraps=self.storage.create) as spied:
+            resp = self.app.post_json(
+                plural_url or self.plural_url, {"data": obj}, headers=self.headers
+            )
+        _seed_parent_ids[resource_name] = spied.call_args.kwargs["parent_id"]
+        return resp.json["data"]
+
 
 @implementer(IAuthorizationPolicy)
 class AllowAuthorizationPolicy:
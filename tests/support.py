@@ -8,6 +8,7 @@ MINIMALIST_COLLECTION = {}
 MINIMALIST_GROUP = {"data": dict(members=["fxa:user"])}
 MINIMALIST_RECORD = {"data": dict(name="Hulled Barley", type="Whole Grain")}
 USER_PRINCIPAL = "basicauth:8a931a10fc88ab2f6d1cc02a07d3a81b5d4768f6f13e85c5d8d4180419acb1b4"
+USER_HEADERS = testing.get_user_headers("mat")
 
 
 class BaseWebTest(testing.BaseWebTest):
@@ -18,7 +19,7 @@ class BaseWebTest(testing.BaseWebTest):
     @classmethod
     def setUpClass(cls):
         super().setUpClass()
-        cls.headers.update(testing.get_user_headers("mat"))
+        cls.headers.update(USER_HEADERS)
 
     @classmethod
     def get_app_settings(cls, extras=None):